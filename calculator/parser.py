@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 
 
@@ -6,6 +7,10 @@ class ParserError(Exception):
     pass
 
 
+# Compiled once so whitespace runs are skipped in C rather than char-by-char.
+_WS_RE = re.compile(r"[ \t\n]*")
+
+
 class ChordParser:
     def __init__(self, input_str):
         self.s = input_str
@@ -28,8 +33,7 @@ class ChordParser:
             raise ParserError(f"Expected '{expected}' but got '{actual}' at position {self.pos}")
 
     def skip_ws(self):
-        while self.peek() == " " or self.peek() == "\t" or self.peek() == "\n":
-            self.next()
+        self.pos = _WS_RE.match(self.s, self.pos).end()
 
     def is_digit(self, c):
         return c is not None and "0" <= c <= "9"
@@ -66,11 +70,22 @@ class ChordParser:
         self.expect("/")
         den = self.parse_denominator()
 
+    def read_digits(self):
+        # Shared digit-run scanner: bump past the run and slice once instead
+        # of growing a string one character at a time.
+        s = self.s
+        n = len(s)
+        start = p = self.pos
+        while p < n and "0" <= s[p] <= "9":
+            p += 1
+        if p == start:
+            return None
+        self.pos = p
+        return s[start:p]
+
     def parse_numerator(self):
-        num_str = ""
-        while self.is_digit(self.peek()):
-            num_str += self.next()
-        if not num_str:
+        num_str = self.read_digits()
+        if num_str is None:
             raise ParserError("Expected numerator")
         num = int(num_str)
         if not (1 <= num <= 15):
@@ -78,10 +93,8 @@ class ChordParser:
         return num
 
     def parse_denominator(self):
-        den_str = ""
-        while self.is_digit(self.peek()):
-            den_str += self.next()
-        if not den_str:
+        den_str = self.read_digits()
+        if den_str is None:
             raise ParserError("Expected denominator")
         den = int(den_str)
         if den not in [1, 2, 4, 8, 16]:
@@ -90,7 +103,7 @@ class ChordParser:
 
     def parse_chords(self):
         self.skip_ws()
-        if self.s[self.pos : self.pos + 2] == "NC":
+        if self.s.startswith("NC", self.pos):
             self.pos += 2
             return
         elif self.peek() == "%":
@@ -142,51 +155,59 @@ class ChordParser:
             raise ParserError("qual and sus cannot coexist")
 
     def parse_optional_qual(self):
-        c = self.peek()
+        # Hot path: index the string directly instead of going through peek/next.
+        s = self.s
+        p = self.pos
+        n = len(s)
+        c = s[p] if p < n else None
         if c in ("-", "+", "o", "5"):
-            self.next()
+            self.pos = p + 1
             return True
         elif c == "1":
-            next_pos = self.pos + 1
-            next_c = self.s[next_pos] if next_pos < len(self.s) else None
+            next_c = s[p + 1] if p + 1 < n else None
             if next_c in ("1", "3"):
                 return False
             else:
-                self.next()
+                self.pos = p + 1
                 return True
         return False
 
     def parse_optional_qnum(self):
-        start_pos = self.pos
+        s = self.s
+        n = len(s)
+        p = self.pos
         caret = False
-        c = self.peek()
+        c = s[p] if p < n else None
         if c == "^":
             caret = True
-            self.next()
-            c = self.peek()
+            p += 1
+            c = s[p] if p < n else None
         if self.is_digit(c):
-            num_str = self.next()
+            num_str = c
+            p += 1
             if num_str in ("6", "7", "9"):
                 if caret and num_str == "6":
-                    self.pos = start_pos
                     return False
             elif num_str == "1":
-                c = self.peek()
+                c = s[p] if p < n else None
                 if c in ("1", "3"):
-                    num_str += self.next()
+                    num_str += c
+                    p += 1
                 else:
-                    self.pos = start_pos
                     return False
             else:
-                self.pos = start_pos
                 return False
             if num_str == "6" and caret:
                 raise ParserError("^6 invalid")
+            self.pos = p
             return True
-        self.pos = start_pos
         return False
 
     def parse_optional_add(self):
+        # First-char gate: bail unless the next char can start an add.
+        c = self.peek()
+        if c not in ("(", "#", "b", "5", "9", "1"):
+            return False
         start_pos = self.pos
         in_paren = False
         if self.peek() == "(":
@@ -200,27 +221,26 @@ class ChordParser:
         return True
 
     def parse_optional_alt(self):
-        start_pos = self.pos
-        if self.peek() in ("#", "b"):
-            self.next()
-        c = self.peek()
-        if c == "5":
-            self.next()
-            return True
-        elif c == "9":
-            self.next()
+        s = self.s
+        n = len(s)
+        p = self.pos
+        if p < n and s[p] in ("#", "b"):
+            p += 1
+        c = s[p] if p < n else None
+        if c == "5" or c == "9":
+            self.pos = p + 1
             return True
         elif c == "1":
-            self.next()
-            c = self.peek()
-            if c in ("1", "3"):
-                self.next()
+            if p + 1 < n and s[p + 1] in ("1", "3"):
+                self.pos = p + 2
                 return True
-        self.pos = start_pos
         return False
 
     def parse_optional_sus(self):
-        if self.s[self.pos : self.pos + 3] == "sus":
+        # First-char gate: skip the slice compare unless we see 's'.
+        if self.pos >= len(self.s) or self.s[self.pos] != "s":
+            return False
+        if self.s.startswith("sus", self.pos):
             self.pos += 3
             c = self.peek()
             if c == "2":
@@ -234,7 +254,9 @@ class ChordParser:
         return False
 
     def parse_optional_omit(self):
-        if self.s[self.pos : self.pos + 2] == "no":
+        if self.pos >= len(self.s) or self.s[self.pos] != "n":
+            return False
+        if self.s.startswith("no", self.pos):
             self.pos += 2
             c = self.peek()
             if c == "3":